@@ -33,6 +33,11 @@ export async function activate(context: vscode.ExtensionContext) {
     // Initialize LogManager FIRST
     try {
         LogManager.initialize(context.extensionPath);
+        context.subscriptions.push(vscode.workspace.onDidChangeConfiguration(e => {
+            if (e.affectsConfiguration('mcpServerManager.logLevel')) {
+                LogManager.setLevel(vscode.workspace.getConfiguration('mcpServerManager').get<string>('logLevel'));
+            }
+        }));
         LogManager.info('Extension', 'MCP Server Manager activating...');
     } catch (e: any) {
         console.error("!!! FAILED TO INITIALIZE LogManager !!!", e);
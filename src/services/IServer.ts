@@ -2,43 +2,43 @@ import { EventEmitter } from 'events';
 import { ServerStatus, ModelRequest } from '../models/Types.js';
 
 /**
- * Interface for a server
+ * Interface for Server implementations
  */
-export interface IServer {
-  /**
-   * Start the server
-   * @returns A promise that resolves when the server is started
-   */
-  start(): Promise<void>;
+export interface IServer extends EventEmitter {
+    /**
+     * Whether the server is ready to receive messages
+     */
+    isReady: boolean;
 
-  /**
-   * Stop the server
-   * @returns A promise that resolves when the server is stopped
-   */
-  stop(): Promise<void>;
+    /**
+     * Start the server
+     */
+    start(): Promise<void>;
 
-  /**
-   * Send a message to the server
-   * @param message The message to send
-   * @returns A promise that resolves with the server's response
-   */
-  sendMessage(message: string): Promise<string>;
+    /**
+     * Send a message request to the server
+     * @param request The ModelRequest object to send
+     * @returns A promise that resolves to the server's response string
+     */
+    sendMessage(request: ModelRequest): Promise<string>;
 
-  /**
-   * Get the status of the server
-   * @returns The status of the server
-   */
-  getStatus(): ServerStatus;
+    /**
+     * Get information about the server process
+     */
+    getProcessInfo(): {pid: number, startTime?: number} | null;
 
-  /**
-   * Get process information for the server
-   * @returns The process information or null if no process is running
-   */
-  getProcessInfo(): { pid: number } | null;
+    /**
+     * Dispose of the server (stop it)
+     */
+    dispose(): void;
 
-  /**
-   * Get whether the server is ready to receive messages
-   * @returns A boolean indicating whether the server is ready
-   */
-  isReady(): boolean;
-} 
\ No newline at end of file
+    /**
+     * Request the server to send its capabilities again.
+     */
+    refreshCapabilities(): Promise<void>;
+
+    /**
+     * Get the status of the server
+     */
+    getStatus(): ServerStatus;
+}
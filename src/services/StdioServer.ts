@@ -9,51 +9,10 @@ import { EventEmitter } from 'events';
 import { logDebug, logError, logInfo, logWarning, getErrorMessage } from '../utils/logger.js';
 import * as vscode from 'vscode';
 import { ConfigStorage } from './ConfigStorage.js';
+import { IServer } from './IServer.js';
 import spawn from 'cross-spawn';
 import { ChildProcess } from 'node:child_process';
 
-/**
- * Interface for Server implementations
- */
-export interface IServer extends EventEmitter {
-    /**
-     * Whether the server is ready to receive messages
-     */
-    isReady: boolean;
-    
-    /**
-     * Start the server
-     */
-    start(): Promise<void>;
-    
-    /**
-     * Send a message request to the server
-     * @param request The ModelRequest object to send
-     * @returns A promise that resolves to the server's response string
-     */
-    sendMessage(request: ModelRequest): Promise<string>;
-    
-    /**
-     * Get information about the server process
-     */
-    getProcessInfo(): {pid: number, startTime?: number} | null;
-    
-    /**
-     * Dispose of the server (stop it)
-     */
-    dispose(): void;
-    
-    /**
-     * Request the server to send its capabilities again.
-     */
-    refreshCapabilities(): Promise<void>;
-
-    /**
-     * Get the status of the server
-     */
-    getStatus(): ServerStatus;
-}
-
 export interface StdioServerConfig {
     command: string;
     args: string[];
@@ -8,6 +8,11 @@ let outputChannel: vscode.OutputChannel | undefined;
 let logFilePath: string | undefined;
 // ---
 
+// Ordered severities for the 'mcpServerManager.logLevel' setting
+export type LogLevel = 'DEBUG' | 'INFO' | 'WARN' | 'ERROR';
+const LOG_LEVELS: Record<LogLevel, number> = { DEBUG: 0, INFO: 1, WARN: 2, ERROR: 3 };
+let minLevel = LOG_LEVELS.INFO;
+
 export class LogManager {
     public static initialize(extensionPath: string): void {
         if (isInitialized) {
@@ -26,6 +31,7 @@ export class LogManager {
             // Set up log file
             const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
             logFilePath = path.join(logsDir, `mcp-manager-${timestamp}.log`);
+            LogManager.setLevel(vscode.workspace.getConfiguration('mcpServerManager').get<string>('logLevel', 'INFO'));
             isInitialized = true; // --- Set flag ---
             LogManager.info('LogManager', `Logging initialized. Log file: ${logFilePath}`);
         } catch (error) {
@@ -34,6 +40,28 @@ export class LogManager {
         }
     }
     
+    /**
+     * Sets the minimum level that gets written. Unknown values fall back to INFO.
+     */
+    public static setLevel(level: string | undefined): void {
+        minLevel = LOG_LEVELS[(level || '').toUpperCase() as LogLevel] ?? LOG_LEVELS.INFO;
+    }
+
+    /**
+     * Whether entries at the given level (DEBUG, INFO, WARN, ERROR) are currently written.
+     */
+    public static isEnabled(level: LogLevel): boolean {
+        return LOG_LEVELS[level] >= minLevel;
+    }
+
+    /**
+     * Whether DEBUG entries are currently written. Hot paths should check this
+     * before building expensive debug messages.
+     */
+    public static isDebugEnabled(): boolean {
+        return LogManager.isEnabled('DEBUG');
+    }
+
     public static info(component: string, message: string, data?: any): void {
         LogManager.log('INFO', component, message, data);
     }
@@ -61,11 +89,13 @@ export class LogManager {
     }
     
     public static debug(component: string, message: string, data?: any): void {
-        // Add conditional check for debug logging if needed later
         LogManager.log('DEBUG', component, message, data);
     }
     
-    private static log(level: string, component: string, message: string, data?: any): void {
+    private static log(level: LogLevel, component: string, message: string, data?: any): void {
+        if (!LogManager.isEnabled(level)) {
+            return;
+        }
         if (!isInitialized) { // <-- Check flag
             console.warn(`[${level.toUpperCase()}] LogManager not initialized. Log attempt: [${component}] ${message}`, data);
             return;
@@ -39,6 +39,9 @@ export function getErrorMessage(error: unknown): string {
 
 // Utility functions for logging
 export function logDebug(message: string, data?: any): void {
+    if (!LogManager.isDebugEnabled()) {
+        return;
+    }
     LogManager.debug(message, data);
     try {
         getOutputChannel().appendLine(`[DEBUG] ${message}`);
@@ -48,6 +51,9 @@ export function logDebug(message: string, data?: any): void {
 }
 
 export function logError(message: string, data?: any): void {
+    if (!LogManager.isEnabled('ERROR')) {
+        return;
+    }
     LogManager.error(message, data);
     try {
         getOutputChannel().appendLine(`[ERROR] ${message}`);
@@ -59,6 +65,9 @@ export function logError(message: string, data?: any): void {
 }
 
 export function logInfo(message: string, data?: any): void {
+    if (!LogManager.isEnabled('INFO')) {
+        return;
+    }
     LogManager.info(message, data);
     try {
         getOutputChannel().appendLine(`[INFO] ${message}`);
@@ -68,6 +77,9 @@ export function logInfo(message: string, data?: any): void {
 }
 
 export function logWarning(message: string, data?: any): void {
+    if (!LogManager.isEnabled('WARN')) {
+        return;
+    }
     LogManager.warn(message, data);
     try {
         getOutputChannel().appendLine(`[WARN] ${message}`);